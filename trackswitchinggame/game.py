@@ -40,6 +40,7 @@ class Game:
         self.score = 0
         self.SCREEN_WIDTH = None
         self.SCREEN_HEIGHT = None
+        self._dirty_rects = []
 
     def run(self, level_file: str):
         """
@@ -71,6 +72,7 @@ class Game:
 
         # Ready to go
         self.running = True
+        self._dirty_rects = [self.screen.get_rect()]
 
         # Game loop
         while self.running:
@@ -78,17 +80,24 @@ class Game:
             self._handle_events()
 
             # Update
+            # Time is only fetched once per frame and handed down to the trains
+            now = pg.time.get_ticks()
             self._update_speed()
-            self._update_trains()
+            self._update_trains(now)
             self.info_board.update(self.map.level_name, self.score, self.trains_speed)
 
             # Re-draw screen
             self.screen.fill(pg.Color("white"))
             self.map.draw(self.screen)
+            train_rects = []
             for train in self.trains:
-                train.draw(self.screen)
-            self.info_board.draw(self.screen, (0, 8*TILE_LENGTH))
-            pg.display.update()
+                train_rects += train.draw(self.screen, now)
+            info_board_rect = self.info_board.draw(self.screen, (0, 8*TILE_LENGTH))
+
+            # Only present the regions that changed: trains at their previous and current positions, switched tiles,
+            # and the information board.
+            pg.display.update(self._dirty_rects + train_rects + [info_board_rect])
+            self._dirty_rects = train_rects
 
             self.clock.tick(self.FPS)
 
@@ -102,6 +111,8 @@ class Game:
         for event in pg.event.get():
             if event.type == pg.QUIT:
                 self.running = False
+            if event.type == pg.WINDOWEXPOSED:
+                self._dirty_rects.append(self.screen.get_rect())
             if event.type == pg.MOUSEBUTTONDOWN and event.button == 1:
                 mouse_position = pg.mouse.get_pos()
 
@@ -113,11 +124,12 @@ class Game:
                             break
                     else:
                         clicked_tile.switch_track()
+                        self._dirty_rects.append(clicked_tile.rect)
             if event.type == pg.KEYDOWN and event.key == pg.K_RETURN and DEBUG:
                 # Debug key to break execution
                 print("Breakpoint activated.")
 
-    def _update_trains(self):
+    def _update_trains(self, now: int):
         """
         Handles all updates for trains:
         - spawn new trains
@@ -125,7 +137,7 @@ class Game:
         - handles despawning and score counting
         """
         # Spawn new train
-        if pg.time.get_ticks() > self._last_train_spawned + self.SPAWN_DELAY_VS_SPEED[self.trains_speed]:
+        if now > self._last_train_spawned + self.SPAWN_DELAY_VS_SPEED[self.trains_speed]:
             self._spawn_new_train()
 
         for train in self.trains:
@@ -142,7 +154,7 @@ class Game:
                 # Check for collisions
 
                 # Update
-                train.update()
+                train.update(now)
 
     def _spawn_new_train(self):
         """
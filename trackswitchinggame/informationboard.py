@@ -48,5 +48,5 @@ class InformationBoard(pg.surface.Surface):
         speed_text_position = speed_offset + Vector2(self._speed_label_text.get_rect().width, 0) + Vector2(5, 0)
         self.blit(speed_text, speed_text_position)
 
-    def draw(self, surface, position):
-        surface.blit(self, position)
+    def draw(self, surface, position) -> pg.Rect:
+        return surface.blit(self, position)
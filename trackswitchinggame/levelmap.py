@@ -5,6 +5,7 @@ from typing import Union
 import json
 
 # import third-party modules
+import numpy as np
 import pygame as pg
 from pygame import Vector2
 
@@ -22,6 +23,7 @@ class LevelMap:
         self._tiles = pg.sprite.Group()
         self._nb_rows = 0
         self._nb_cols = 0
+        self._grid = None  # (nb_rows, nb_cols) array of TrackTile or None, initialized when parsing the map
 
         # Load level from file
         with open(level_file) as f:
@@ -46,14 +48,25 @@ class LevelMap:
                 except KeyError:
                     self._platforms[tile.platform] = pg.sprite.Group(tile)
 
+        # Tiles never move, so the bounding rects of portals and platforms are computed once
+        self._portal_rects = {portal: group.sprites()[0].rect.copy() for portal, group in self._portals.items()}
+        self._platform_rects = dict()
+        for platform, group in self._platforms.items():
+            sprites = group.sprites()
+            self._platform_rects[platform] = sprites[0].rect.unionall([sprite.rect for sprite in sprites[1:]])
+
+        # Tiles keep the same image and rect objects, so the whole map can be drawn with a single blits() call
+        self._blit_sequence = [(tile.image, tile.rect) for tile in self.tiles.sprites()]
+
     def draw(self, surf: pg.surface.Surface):
-        for tile in self.tiles.sprites():
-            surf.blit(tile.image, tile.rect)
+        surf.blits(self._blit_sequence, doreturn=False)
 
     def tile_at(self, pos: Vector2) -> Union[TrackTile, None]:
-        for tile in self.tiles.sprites():
-            if tile.rect.collidepoint(pos.x, pos.y):
-                return tile
+        return self.tile_at_grid(int(pos.x) // TILE_LENGTH, int(pos.y) // TILE_LENGTH)
+
+    def tile_at_grid(self, grid_x: int, grid_y: int) -> Union[TrackTile, None]:
+        if 0 <= grid_x < self._nb_cols and 0 <= grid_y < self._nb_rows:
+            return self._grid[grid_y, grid_x]
         return None
 
     def get_playing_field_rect(self) -> pg.Rect:
@@ -104,6 +117,12 @@ class LevelMap:
             tiles_array.append(tile_row)
             del tile_row  # Check if necessary
 
+        # Keep tiles in a grid for constant-time lookups by position
+        self._grid = np.empty((self._nb_rows, self._nb_cols), dtype=object)
+        for row_id, tile_row in enumerate(tiles_array):
+            for col_id, tile in enumerate(tile_row):
+                self._grid[row_id, col_id] = tile
+
         # Find neighbours
         neighbours_offset_map = {NW: Vector2(-TILE_LENGTH, -TILE_LENGTH),
                                  N: Vector2(0, -TILE_LENGTH),
@@ -132,6 +151,14 @@ class LevelMap:
     def platforms(self) -> dict:
         return self._platforms
 
+    @property
+    def portal_rects(self) -> dict[str, pg.Rect]:
+        return self._portal_rects
+
+    @property
+    def platform_rects(self) -> dict[str, pg.Rect]:
+        return self._platform_rects
+
     @property
     def nb_rows(self) -> int:
         return self._nb_rows
@@ -3,12 +3,35 @@
 # import built-in module
 
 # import third-party modules
+import numpy as np
 import pygame as pg
 from pygame.math import Vector2
 
 # import your own module
 from trackswitchinggame.constants import *
 
+# Tile images are shared by all tiles with the same path, so each image file is only loaded once
+_TILE_IMAGE_CACHE = dict()
+_INACTIVE_TILE_IMAGE_CACHE = dict()
+
+
+def _load_tile_image(path: str) -> pg.surface.Surface:
+    image = _TILE_IMAGE_CACHE.get(path)
+    if image is None:
+        image = pg.image.load(path).convert_alpha()
+        _TILE_IMAGE_CACHE[path] = image
+    return image
+
+
+def _load_inactive_tile_image(path: str) -> pg.surface.Surface:
+    # Semi-transparent copy of the tile image, used to draw inactive paths in grey
+    image = _INACTIVE_TILE_IMAGE_CACHE.get(path)
+    if image is None:
+        image = _load_tile_image(path).copy()
+        image.set_alpha(128)
+        _INACTIVE_TILE_IMAGE_CACHE[path] = image
+    return image
+
 
 class TrackTile(pg.sprite.Sprite):
     """
@@ -44,7 +67,17 @@ class TrackTile(pg.sprite.Sprite):
         else:
             self._alt_path_points = list()
 
+        # Trajectories only depend on the paths, so they are computed once
+        self._traj_main = self._build_trajectory(self._main_path)
+        self._traj_alt = self._build_trajectory(self._alt_path) if self._alt_path else None
+        self._entry_points_main = self._build_entry_points(self._traj_main)
+        self._entry_points_alt = self._build_entry_points(self._traj_alt) if self._alt_path else None
+
+        # Image is re-drawn in place and rect never changes, so both can be referenced for the whole game
         self.image = pg.Surface((TILE_LENGTH, TILE_LENGTH))
+        self.rect = self.image.get_rect()
+        self.rect.x = self._position[0]
+        self.rect.y = self._position[1]
         self._update_image()
 
     def switch_track(self):
@@ -56,31 +89,11 @@ class TrackTile(pg.sprite.Sprite):
                 self._active_path = "main"
             self._update_image()
 
-    def get_trajectory(self) -> list[Vector2]:
-        # Give list of points corresponding to the current track configuration
-        trajectory = list()
-
-        current_path = str()
-        if self._active_path == "main":
-            current_path = self._main_path
-        elif self._active_path == "alt":
-            current_path = self._alt_path
-
-        if current_path[0] == "u":
-            trajectory += [self._position + Vector2(i, i) for i in range(16)]
-        elif current_path[0] == "m":
-            trajectory += [self._position + Vector2(i, 15) for i in range(16)]
-        elif current_path[0] == "d":
-            trajectory += [self._position + Vector2(i, 31 - i) for i in range(16)]
-
-        if current_path[1] == "u":
-            trajectory += [self._position + Vector2(16 + i, 15 - i) for i in range(16)]
-        elif current_path[1] == "m":
-            trajectory += [self._position + Vector2(16 + i, 15) for i in range(16)]
-        elif current_path[1] == "d":
-            trajectory += [self._position + Vector2(16 + i, 16 + i) for i in range(16)]
-
-        return trajectory
+    def get_trajectory(self) -> np.ndarray:
+        # Give (N, 2) read-only array of points corresponding to the current track configuration
+        if self._active_path == "alt" and self._alt_path:
+            return self._traj_alt
+        return self._traj_main
 
     def set_neighbour(self, compass_direction: str, tile: "TrackTile"):
         self._neighbours[compass_direction] = tile
@@ -88,6 +101,34 @@ class TrackTile(pg.sprite.Sprite):
     def get_neighbour(self, compass_direction: str) -> "TrackTile":
         return self._neighbours[compass_direction]
 
+    def _build_trajectory(self, path: str) -> np.ndarray:
+        steps = np.arange(16, dtype=np.float32)
+        middle = np.full(16, 15, dtype=np.float32)
+
+        if path[0] == "u":
+            first_half = np.column_stack((steps, steps))
+        elif path[0] == "m":
+            first_half = np.column_stack((steps, middle))
+        elif path[0] == "d":
+            first_half = np.column_stack((steps, 31 - steps))
+
+        if path[1] == "u":
+            second_half = np.column_stack((16 + steps, 15 - steps))
+        elif path[1] == "m":
+            second_half = np.column_stack((16 + steps, middle))
+        elif path[1] == "d":
+            second_half = np.column_stack((16 + steps, 16 + steps))
+
+        trajectory = np.concatenate((first_half, second_half))
+        trajectory += np.array((self._position.x, self._position.y), dtype=np.float32)
+        trajectory.flags.writeable = False
+        return trajectory
+
+    @staticmethod
+    def _build_entry_points(trajectory: np.ndarray) -> frozenset:
+        # A trajectory can be entered from either of its ends
+        return frozenset((int(point[0]), int(point[1])) for point in (trajectory[0], trajectory[-1]))
+
     def _update_image(self):
         # Portals and platforms have specific background text and colors
         if self._portal is not None:
@@ -102,32 +143,32 @@ class TrackTile(pg.sprite.Sprite):
             self.image.fill(pg.Color("white"))
 
         # Draw inactive path in grey
-        tmp_tile = pg.surface.Surface((TILE_LENGTH, TILE_LENGTH), pg.SRCALPHA)
         if self._active_path == "alt":
-            tmp_tile = pg.image.load(f"assets/tiles/{self._main_path}.png").convert_alpha()
+            self.image.blit(_load_inactive_tile_image(f"assets/tiles/{self._main_path}.png"), (0, 0))
         elif self._active_path == "main" and self._alt_path:
-            tmp_tile = pg.image.load(f"assets/tiles/{self._alt_path}.png").convert_alpha()
-        tmp_tile.set_alpha(128)
-        self.image.blit(tmp_tile, (0, 0))
+            self.image.blit(_load_inactive_tile_image(f"assets/tiles/{self._alt_path}.png"), (0, 0))
 
         # Draw active path in black
         if self._active_path == "main":
-            tmp_tile = pg.image.load(f"assets/tiles/{self._main_path}.png").convert_alpha()
+            self.image.blit(_load_tile_image(f"assets/tiles/{self._main_path}.png"), (0, 0))
         elif self._active_path == "alt" and self._alt_path:
-            tmp_tile = pg.image.load(f"assets/tiles/{self._alt_path}.png").convert_alpha()
-        self.image.blit(tmp_tile, (0, 0))
+            self.image.blit(_load_tile_image(f"assets/tiles/{self._alt_path}.png"), (0, 0))
 
         if DEBUG:
             # Draw trajectory in red on top (debug)
             for point in self.get_trajectory():
-                self.image.fill(pg.Color("lightcoral"), (point - self._position, (1, 1)))
+                self.image.fill(pg.Color("lightcoral"),
+                                ((point[0] - self._position.x, point[1] - self._position.y), (1, 1)))
 
             # Draw limits in red on top (debug)
             pg.draw.rect(self.image, pg.Color("lightcoral"), self.image.get_rect(), 1)
 
-        self.rect = self.image.get_rect()
-        self.rect.x = self._position[0]
-        self.rect.y = self._position[1]
+    @property
+    def entry_points(self) -> frozenset:
+        # Integer (x, y) coordinates of both ends of the current trajectory
+        if self._active_path == "alt" and self._alt_path:
+            return self._entry_points_alt
+        return self._entry_points_main
 
     @property
     def portal(self) -> str:
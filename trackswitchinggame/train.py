@@ -4,14 +4,54 @@
 import math
 
 # import third-party modules
+import numpy as np
 import pygame as pg
 from pygame import Vector2
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional, kernels then run as plain Python functions
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
 
 # import your own module
 from trackswitchinggame.wagonsprite import WagonSprite
 from trackswitchinggame.levelmap import LevelMap
 from trackswitchinggame.constants import *
 
+# Bits of Train._flags
+F_SPAWNED = 1
+F_MOVING = 2
+F_WAITING = 4
+F_PLATFORM_REACHED = 8
+F_PLATFORM_SUCCEEDED = 16
+F_EXIT_PORTAL_REACHED = 32
+F_EXIT_PORTAL_SUCCEEDED = 64
+
+
+@njit(cache=True)
+def _wagon_positions(traj_buf: np.ndarray, head: int, rightmost_position_pointer: int, wagon_lengths: np.ndarray):
+    """
+    Compute the position of both axles and the left edge of each wagon from the trajectory ring buffer.
+    """
+    capacity = traj_buf.shape[0]
+    nb_wagons = wagon_lengths.shape[0]
+    positions_axle_1 = np.empty((nb_wagons, 2), dtype=np.float32)
+    positions_axle_2 = np.empty((nb_wagons, 2), dtype=np.float32)
+    rects_x = np.empty(nb_wagons, dtype=np.float32)
+
+    current_offset = rightmost_position_pointer
+    for i in range(nb_wagons):
+        # Should the position of the axles be handled individually by each wagon?
+        # Do we want wagons to have a variable axle offset??
+        positions_axle_1[i] = traj_buf[(head + current_offset - 5) % capacity]
+        positions_axle_2[i] = traj_buf[(head + current_offset - 24) % capacity]
+        current_offset -= wagon_lengths[i]
+        rects_x[i] = traj_buf[(head + current_offset + 1) % capacity, 0]
+    return positions_axle_1, positions_axle_2, rects_x
+
 
 class Train:
     """
@@ -19,7 +59,9 @@ class Train:
     A train spawns at a given entry_portal, will wait at a platform and despawn at an exit portal.
     Specific platform and exit_portal are provided as a goal to the player, but the train will wait at any platform,
     and despawn at any portal it crosses.
-    The train's movement follow points stored in trajectory.
+    The train's movement follow points stored in trajectory, a (N, 2) float32 array of x and y coordinates.
+    Internally, the trajectory is kept in a ring buffer so that tiles can be added and removed at both ends without
+    copying the whole trajectory. Position pointers are offsets relative to the head of the ring buffer.
     """
 
     WAIT_DELAY_VS_SPEED = {1: 5000,
@@ -28,332 +70,402 @@ class Train:
                            4: 2000,
                            5: 1000}
 
+    TRAJECTORY_INITIAL_CAPACITY = 8 * TILE_LENGTH
+
+    WAIT_INDICATOR_NB_STEPS = 64
+    _wait_indicator_frames = None  # Shared by all trains, rendered when the first train is created
+
     def __init__(self, levelmap: LevelMap, entry_portal: str, platform: str, exit_portal: str):
         self._levelmap = levelmap
-        self.trajectory = list()
-        self.rightmost_position_pointer = None  # Initialized when calling spawn()
+        self._traj_buf = np.empty((self.TRAJECTORY_INITIAL_CAPACITY, 2), dtype=np.float32)
+        self._head = 0  # Logical index of the first point, physical index is taken modulo the capacity
+        self._tail = 0  # Logical index one past the last point
+        # Both pointers are initialized when calling spawn(), the leftmost one follows the rightmost one
+        self._rightmost_position_pointer = None
+        self._leftmost_position_pointer = None
         self.speed = 1
 
         # Set-up wagons
-        self._wagons = pg.sprite.Group()
+        self._wagons = pg.sprite.RenderUpdates()
         self._wagons.add(WagonSprite("assets/trains/ice_loc.png"))
         self._wagons.add(WagonSprite("assets/trains/ice_wagon.png"))
         self._wagons.add(WagonSprite("assets/trains/ice_loc.png", True))
+        self._wagons_tuple = tuple(self._wagons.sprites())  # Wagons never change after set-up
+        self._wagon_lengths = np.array([wagon.length for wagon in self._wagons], dtype=np.int32)
+        self._length = int(self._wagon_lengths.sum())
+        self._rect = None
+        self._update_rect()
 
         # Goals
         self._entry_portal = entry_portal
         self._platform = platform
-        self._platform_status = PENDING
         self._exit_portal = exit_portal
-        self._exit_portal_status = PENDING
 
-        # State variables
-        self._spawned = False
-        self._moving = False
-        self._waiting = False
+        # State variables, including goal statuses, packed as F_* bits
+        self._flags = 0
         self.direction = None
+        self._dir_sign = 1  # +1 when moving forward, -1 when moving backward
         self._wait_end = 0
         self._wait_total = 0
+        self._now = pg.time.get_ticks()  # Time of the last update, in milliseconds
 
         # Indicators
         self._GOAL_INDICATOR_SIZE = 10
         self._WAIT_INDICATOR_SIZE = 14
         self._font = pg.font.SysFont("Verdana", self._GOAL_INDICATOR_SIZE)
+        self._platform_indicator = self._render_goal_indicator(self._platform, pg.Color("lightgreen"))
+        self._exit_portal_indicator = self._render_goal_indicator(self._exit_portal, pg.Color("lightblue"))
+        if Train._wait_indicator_frames is None:
+            Train._wait_indicator_frames = [self._render_wait_indicator(i / self.WAIT_INDICATOR_NB_STEPS * 2 * math.pi)
+                                            for i in range(self.WAIT_INDICATOR_NB_STEPS + 1)]
 
         # Prepare trajectory for the spawn
         portal_tile = self._levelmap.portals[self._entry_portal].sprites()[0]
         spawn_tile_traj = portal_tile.get_trajectory()
         nb_padding_tiles = math.ceil(self.length / TILE_LENGTH)
+        padding_steps = np.arange(nb_padding_tiles * TILE_LENGTH, dtype=np.float32)
+        padding_y = np.full(nb_padding_tiles * TILE_LENGTH, spawn_tile_traj[0, 1], dtype=np.float32)
         if (portal_tile.get_neighbour(NW) is None) and \
                 (portal_tile.get_neighbour(W) is None) and \
                 (portal_tile.get_neighbour(SW) is None):
-            for i in range(nb_padding_tiles * TILE_LENGTH):
-                self.trajectory.append(Vector2(-(nb_padding_tiles * TILE_LENGTH) + i, spawn_tile_traj[0].y))
-            self.trajectory += spawn_tile_traj
+            padding = np.column_stack((-(nb_padding_tiles * TILE_LENGTH) + padding_steps, padding_y))
+            self._extend_right(padding)
+            self._extend_right(spawn_tile_traj)
             self.direction = FORWARD
-            self.rightmost_position_pointer = len(self.trajectory) - 1
+            self.rightmost_position_pointer = self.trajectory_length - 1
         elif (portal_tile.get_neighbour(NE) is None) and \
                 (portal_tile.get_neighbour(E) is None) and \
                 (portal_tile.get_neighbour(SE) is None):
-            self.trajectory += spawn_tile_traj
-            for i in range(nb_padding_tiles * TILE_LENGTH):
-                self.trajectory.append(Vector2(spawn_tile_traj[-1].x + i, spawn_tile_traj[0].y))
+            padding = np.column_stack((spawn_tile_traj[-1, 0] + padding_steps, padding_y))
+            self._extend_right(spawn_tile_traj)
+            self._extend_right(padding)
             self.direction = BACKWARD
             self.leftmost_position_pointer = 0
 
-    def update(self):
+    def update(self, now: int):
         """
-        Update position of the train
+        Update position of the train, now being the current time in milliseconds.
         """
-        if self._platform_status == PENDING:
+        self._now = now
+
+        if not self._flags & F_PLATFORM_REACHED:
             self._check_for_platform()
-        elif self._exit_portal_status == PENDING:
+        elif not self._flags & F_EXIT_PORTAL_REACHED:
             self._check_for_exit_portal()
 
-        if self.moving:
+        if self._flags & F_MOVING:
             # Update position
             self._update_trajectory()
             self.rightmost_position_pointer += self.trajectory_pointer_increment
-            if self.rightmost_position_pointer >= len(self.trajectory) or self.leftmost_position_pointer < 0:
+            if self.rightmost_position_pointer >= self.trajectory_length or self.leftmost_position_pointer < 0:
                 # No trajectory defined, we do not move.
                 self.rightmost_position_pointer -= self.trajectory_pointer_increment
             else:
-                current_offset = self.rightmost_position_pointer
-
-                for wagon in self._wagons.sprites():
-                    # Should the position of the axles be handled individually by each wagon?
-                    # Do we want wagons to have a variable axle offset??
-                    axle_1_pointer = current_offset - 5
-                    axle_2_pointer = current_offset - 24
-                    position_axle_1 = self.trajectory[axle_1_pointer]
-                    position_axle_2 = self.trajectory[axle_2_pointer]
+                positions_axle_1, positions_axle_2, rects_x = _wagon_positions(
+                    self._traj_buf, self._head, self.rightmost_position_pointer, self._wagon_lengths)
+                for wagon, position_axle_1, position_axle_2, rect_x in zip(self._wagons_tuple, positions_axle_1,
+                                                                           positions_axle_2, rects_x):
                     wagon.update(position_axle_1, position_axle_2)
-                    current_offset -= wagon.length
-                    wagon.rect.x = self.trajectory[current_offset + 1].x
+                    wagon.rect.x = rect_x
+                self._update_rect()
 
-        if self.waiting:
-            if pg.time.get_ticks() > self._wait_end:
-                self._waiting = False
+        if self._flags & F_WAITING:
+            if now > self._wait_end:
+                self._flags &= ~F_WAITING
                 self.start(self.direction)
 
-    def draw(self, screen: pg.surface.Surface):
+    def draw(self, screen: pg.surface.Surface, now: int) -> list[pg.Rect]:
         """
-        Draw the train.
+        Draw the train, now being the current time in milliseconds.
+        Returns the list of screen areas that were drawn on.
         """
-        if self.spawned:
+        dirty_rects = list()
+        if self._flags & F_SPAWNED:
             # Draw wagons
-            self._wagons.draw(screen)
+            dirty_rects += self._wagons.draw(screen)
 
             # Draw current goal on first front-facing wagon
-            goal_indicator = pg.surface.Surface((self._GOAL_INDICATOR_SIZE, self._GOAL_INDICATOR_SIZE))
-
-            if self._platform_status == PENDING:
-                goal_indicator.fill(pg.Color("lightgreen"))
-                goal_indicator.blit(self._font.render(self._platform, True, pg.Color("black")),
-                                    (3, 1))
-            elif self._exit_portal_status == PENDING:
-                goal_indicator.fill(pg.Color("lightblue"))
-                goal_indicator.blit(self._font.render(self._exit_portal, True, pg.Color("black")),
-                                    (3, 1))
-            else:
-                goal_indicator.set_alpha(0)
-
-            goal_indicator_rect = goal_indicator.get_rect()
-            if self.direction == FORWARD:
-                first_wagon = self._wagons.sprites()[0]
-            elif self.direction == BACKWARD:
-                first_wagon = self._wagons.sprites()[-1]
-            goal_indicator_rect.center = first_wagon.rect.center
-
-            screen.blit(goal_indicator, goal_indicator_rect)
-
-            if self.waiting:
-                # Draw wait indicator in front of train
-                wait_indicator = pg.Surface((self._WAIT_INDICATOR_SIZE, self._WAIT_INDICATOR_SIZE))
-                wait_indicator.fill(pg.Color("white"))
-                wait_indicator.set_colorkey(pg.Color("white"))
-                pg.draw.arc(wait_indicator, pg.Color("darkorange"), wait_indicator.get_rect(),
-                            0, (self._wait_end - pg.time.get_ticks()) / self._wait_total * 2 * math.pi,
-                            2)
+            goal_indicator = None
+            if not self._flags & F_PLATFORM_REACHED:
+                goal_indicator = self._platform_indicator
+            elif not self._flags & F_EXIT_PORTAL_REACHED:
+                goal_indicator = self._exit_portal_indicator
+
+            if goal_indicator is not None:
+                goal_indicator_rect = goal_indicator.get_rect()
+                goal_indicator_rect.center = self.first_wagon.rect.center
+
+                dirty_rects.append(screen.blit(goal_indicator, goal_indicator_rect))
+
+            if self._flags & F_WAITING:
+                # Draw wait indicator in front of train, using the pre-rendered frame closest to the remaining time
+                step = round((self._wait_end - now) / self._wait_total * self.WAIT_INDICATOR_NB_STEPS)
+                wait_indicator = self._wait_indicator_frames[min(max(step, 0), self.WAIT_INDICATOR_NB_STEPS)]
                 wait_indicator_rect = wait_indicator.get_rect()
                 if self.direction == FORWARD:
-                    wait_indicator_rect.center = self._wagons.sprites()[0].rect.center + Vector2(TILE_LENGTH, 0)
+                    wait_indicator_rect.center = self.first_wagon.rect.center + Vector2(TILE_LENGTH, 0)
                 elif self.direction == BACKWARD:
-                    wait_indicator_rect.center = self._wagons.sprites()[-1].rect.center - Vector2(TILE_LENGTH, 0)
-                screen.blit(wait_indicator, wait_indicator_rect)
+                    wait_indicator_rect.center = self.first_wagon.rect.center - Vector2(TILE_LENGTH, 0)
+                dirty_rects.append(screen.blit(wait_indicator, wait_indicator_rect))
+
+        return dirty_rects
 
     def start(self, direction: str):
         """
         Sets train in movement in desired direction.
         """
-        if not self.waiting:
+        if not self._flags & F_WAITING:
             self.direction = direction
-            self._moving = True
+            self._dir_sign = 1 if direction == FORWARD else -1
+            self._flags |= F_MOVING
 
     def stop(self):
         """
         Train stops.
         """
-        self._moving = False
+        self._flags &= ~F_MOVING
 
     def spawn(self):
         """
         Spawn train.
         """
-        self._spawned = True
+        self._flags |= F_SPAWNED
         self.start(self.direction)
         self.wait(self.WAIT_DELAY_VS_SPEED[self.speed])
 
         # This update allows the train to appear at the right position, even though it is currently waiting.
-        current_offset = self.rightmost_position_pointer
-        for wagon in self._wagons.sprites():
-            # Should the position of the axles be handled individually by each wagon?
-            # Do we want wagons to have a variable axle offset??
-            axle_1_pointer = current_offset - 5
-            axle_2_pointer = current_offset - 24
-            position_axle_1 = self.trajectory[axle_1_pointer]
-            position_axle_2 = self.trajectory[axle_2_pointer]
+        # It also absorbs the compilation latency of _wagon_positions() while the train waits.
+        positions_axle_1, positions_axle_2, _ = _wagon_positions(
+            self._traj_buf, self._head, self.rightmost_position_pointer, self._wagon_lengths)
+        for wagon, position_axle_1, position_axle_2 in zip(self._wagons_tuple, positions_axle_1,
+                                                           positions_axle_2):
             wagon.update(position_axle_1, position_axle_2)
-            current_offset -= wagon.length
+        self._update_rect()
 
     def despawn(self):
         """
         Despawn train.
         """
-        self._spawned = False
+        self._flags &= ~F_SPAWNED
         self.stop()
 
     def wait(self, milliseconds: int):
         """
         Wait for number of milliseconds.
         """
-        self._wait_end = pg.time.get_ticks() + milliseconds
+        self._wait_end = self._now + milliseconds
         self._wait_total = milliseconds
         self.stop()
-        self._waiting = True
+        self._flags |= F_WAITING
 
     def colliderect(self, rect: pg.Rect) -> bool:
         """
         Checks if the train collides a Rect.
         """
-        for point in self.trajectory[self.leftmost_position_pointer:self.rightmost_position_pointer]:
-            if rect.collidepoint(point.x, point.y):
-                return True
-        return False
+        # Cheap bounding box pre-test before looking at individual trajectory points
+        if not rect.colliderect(self.rect):
+            return False
+
+        points = self._points_at(np.arange(self.leftmost_position_pointer, self.rightmost_position_pointer))
+        xs = points[:, 0]
+        ys = points[:, 1]
+        return bool(((xs >= rect.x) & (xs < rect.x + rect.w) & (ys >= rect.y) & (ys < rect.y + rect.h)).any())
 
     def _check_for_platform(self):
-        for platform, group in self._levelmap.platforms.items():
-            rect = None
-            for sprite in group:
-                if not rect:
-                    rect = sprite.rect
-                else:
-                    rect = rect.union(sprite.rect)
+        for platform, rect in self._levelmap.platform_rects.items():
             if rect.contains(self.rect):
                 self.wait(self.WAIT_DELAY_VS_SPEED[self.speed])
 
                 # Change direction based on exit goal
-                train_position = self.trajectory[self.leftmost_position_pointer]
-                exit_portal_position = Vector2(self._levelmap.portals[self._exit_portal].sprites()[0].rect.center)
-                if train_position.x - exit_portal_position.x > 0:
+                train_position = self._points_at(self.leftmost_position_pointer)
+                exit_portal_rect = self._levelmap.portal_rects[self._exit_portal]
+                if train_position[0] - exit_portal_rect.centerx > 0:
                     self.direction = BACKWARD
                 else:
                     self.direction = FORWARD
 
                 # Check if platform goal was successful or not
                 if self._platform == platform:
-                    self._platform_status = SUCCEEDED
+                    self._flags |= F_PLATFORM_REACHED | F_PLATFORM_SUCCEEDED
                 else:
-                    self._platform_status = FAILED
+                    self._flags |= F_PLATFORM_REACHED
                 break
 
     def _check_for_exit_portal(self):
-        for portal, group in self._levelmap.portals.items():
-            tile = group.sprites()[0]
-            if self.rect.colliderect(tile.rect):
-                if tile.portal == self._exit_portal:
-                    self._exit_portal_status = SUCCEEDED
+        for portal, rect in self._levelmap.portal_rects.items():
+            if self.rect.colliderect(rect):
+                if portal == self._exit_portal:
+                    self._flags |= F_EXIT_PORTAL_REACHED | F_EXIT_PORTAL_SUCCEEDED
                 else:
-                    self._exit_portal_status = FAILED
+                    self._flags |= F_EXIT_PORTAL_REACHED
                 break
 
     def _update_trajectory(self):
         if self.direction == FORWARD:
-            if (self.rightmost_position_pointer + self.trajectory_pointer_increment) >= len(self.trajectory):
+            if (self.rightmost_position_pointer + self.trajectory_pointer_increment) >= self.trajectory_length:
                 # We need to fetch trajectory information from next tile
-                train_vector = self.trajectory[-1] - self.trajectory[-2]
-                next_tile_position = self.trajectory[-1] + train_vector
-                next_tile = self._levelmap.tile_at(next_tile_position)
+                last_point, second_to_last_point = self._points_at([self.trajectory_length - 1,
+                                                                    self.trajectory_length - 2])
+                next_tile_position = last_point + (last_point - second_to_last_point)
+                next_tile = self._levelmap.tile_at_grid(int(next_tile_position[0]) // TILE_LENGTH,
+                                                        int(next_tile_position[1]) // TILE_LENGTH)
                 if next_tile:
-                    new_trajectory = next_tile.get_trajectory()
                     # Check if our entry point is valid for the next tile
-                    if next_tile_position in new_trajectory:
-                        self.trajectory += new_trajectory
+                    if (int(next_tile_position[0]), int(next_tile_position[1])) in next_tile.entry_points:
+                        self._extend_right(next_tile.get_trajectory())
                 else:
                     # No next tile, which means we are headed out of playing field.
                     # Padding with a straight trajectory for now.
-                    last_point = self.trajectory[-1]
-                    self.trajectory += [last_point + Vector2(i, 0) for i in range(TILE_LENGTH)]
+                    self._extend_right(last_point + self._straight_padding(0))
 
             if (self.leftmost_position_pointer + self.trajectory_pointer_increment) >= TILE_LENGTH:
                 # We can delete trajectory information from last tile
-                self.trajectory = self.trajectory[TILE_LENGTH:]
+                self._pop_left(TILE_LENGTH)
                 self.rightmost_position_pointer -= TILE_LENGTH
 
         elif self.direction == BACKWARD:
             if (self.leftmost_position_pointer + self.trajectory_pointer_increment) < 0:
                 # We need to fetch trajectory information from previous tile
-                train_vector = self.trajectory[0] - self.trajectory[1]
-                next_tile_position = self.trajectory[0] + train_vector
-                next_tile = self._levelmap.tile_at(next_tile_position)
+                first_point, second_point = self._points_at([0, 1])
+                next_tile_position = first_point + (first_point - second_point)
+                next_tile = self._levelmap.tile_at_grid(int(next_tile_position[0]) // TILE_LENGTH,
+                                                        int(next_tile_position[1]) // TILE_LENGTH)
                 if next_tile:
-                    new_trajectory = next_tile.get_trajectory()
                     # Check if our entry point is valid for the next tile
-                    if next_tile_position in new_trajectory:
-                        self.trajectory = new_trajectory + self.trajectory
+                    if (int(next_tile_position[0]), int(next_tile_position[1])) in next_tile.entry_points:
+                        self._extend_left(next_tile.get_trajectory())
                         self.rightmost_position_pointer += TILE_LENGTH
                 else:
                     # No next tile, which means we are headed out of playing field.
                     # Padding with a straight trajectory for now.
-                    last_point = self.trajectory[0]
-                    self.trajectory = [last_point + Vector2(-TILE_LENGTH + i, 0) for i in
-                                       range(TILE_LENGTH)] + self.trajectory
+                    self._extend_left(first_point + self._straight_padding(-TILE_LENGTH))
                     self.rightmost_position_pointer += TILE_LENGTH
 
             if (self.rightmost_position_pointer + self.trajectory_pointer_increment) < (
-                    len(self.trajectory) - TILE_LENGTH):
+                    self.trajectory_length - TILE_LENGTH):
                 # We can delete trajectory information from last tile
-                self.trajectory = self.trajectory[:-TILE_LENGTH]
+                self._pop_right(TILE_LENGTH)
+
+    def _points_at(self, pointers) -> np.ndarray:
+        # Gather trajectory point(s) at the given pointer(s), relative to the head of the ring buffer
+        return self._traj_buf[(self._head + np.asarray(pointers)) % len(self._traj_buf)]
+
+    def _extend_right(self, points: np.ndarray):
+        self._reserve(len(points))
+        self._traj_buf[(self._tail + np.arange(len(points))) % len(self._traj_buf)] = points
+        self._tail += len(points)
+
+    def _extend_left(self, points: np.ndarray):
+        self._reserve(len(points))
+        self._head -= len(points)
+        self._traj_buf[(self._head + np.arange(len(points))) % len(self._traj_buf)] = points
+
+    def _pop_left(self, nb_points: int):
+        self._head += nb_points
+
+    def _pop_right(self, nb_points: int):
+        self._tail -= nb_points
+
+    def _reserve(self, nb_points: int):
+        # Double the capacity of the ring buffer until nb_points more points fit, keeping the points in order
+        length = self.trajectory_length
+        capacity = len(self._traj_buf)
+        if capacity - length >= nb_points:
+            return
+        while capacity - length < nb_points:
+            capacity *= 2
+        traj_buf = np.empty((capacity, 2), dtype=np.float32)
+        traj_buf[:length] = self.trajectory
+        self._traj_buf = traj_buf
+        self._head = 0
+        self._tail = length
+
+    def _render_goal_indicator(self, goal: str, color: pg.Color) -> pg.surface.Surface:
+        goal_indicator = pg.surface.Surface((self._GOAL_INDICATOR_SIZE, self._GOAL_INDICATOR_SIZE))
+        goal_indicator.fill(color)
+        goal_indicator.blit(self._font.render(goal, True, pg.Color("black")), (3, 1))
+        return goal_indicator
+
+    def _render_wait_indicator(self, angle: float) -> pg.surface.Surface:
+        wait_indicator = pg.Surface((self._WAIT_INDICATOR_SIZE, self._WAIT_INDICATOR_SIZE))
+        wait_indicator.fill(pg.Color("white"))
+        wait_indicator.set_colorkey(pg.Color("white"))
+        pg.draw.arc(wait_indicator, pg.Color("darkorange"), wait_indicator.get_rect(), 0, angle, 2)
+        return wait_indicator
+
+    def _update_rect(self):
+        # Bounding box of all wagons, to be refreshed whenever wagons move
+        if self._wagons_tuple:
+            rect = self._wagons_tuple[0].rect
+            self._rect = rect.unionall([wagon.rect for wagon in self._wagons_tuple])
+        else:
+            self._rect = None
+
+    @staticmethod
+    def _straight_padding(start: int) -> np.ndarray:
+        # Offsets of a straight horizontal trajectory spanning one tile, starting at x offset start
+        return np.column_stack((np.arange(start, start + TILE_LENGTH, dtype=np.float32),
+                                np.zeros(TILE_LENGTH, dtype=np.float32)))
+
+    @property
+    def trajectory(self) -> np.ndarray:
+        # Copy of the points currently in the ring buffer, in order
+        return self._points_at(np.arange(self.trajectory_length))
+
+    @property
+    def trajectory_length(self) -> int:
+        return self._tail - self._head
+
+    @property
+    def rightmost_position_pointer(self):
+        return self._rightmost_position_pointer
+
+    @rightmost_position_pointer.setter
+    def rightmost_position_pointer(self, p):
+        self._rightmost_position_pointer = p
+        self._leftmost_position_pointer = p - self._length + 1
 
     @property
     def leftmost_position_pointer(self):
-        return self.rightmost_position_pointer - self.length + 1
+        return self._leftmost_position_pointer
 
     @leftmost_position_pointer.setter
     def leftmost_position_pointer(self, p):
-        self.rightmost_position_pointer = p + self.length - 1
+        self.rightmost_position_pointer = p + self._length - 1
 
     @property
     def trajectory_pointer_increment(self):
-        if self.moving:
-            if self.direction == FORWARD:
-                return self.speed
-            elif self.direction == BACKWARD:
-                return -1*self.speed
-        else:
-            return 0
+        return self.speed * self._dir_sign if self._flags & F_MOVING else 0
 
     @property
     def length(self):
-        length = 0
-        for wagon in self._wagons:
-            length += wagon.length
-        return length
+        return self._length
 
     @property
     def rect(self):
-        if self._wagons:
-            rect = self._wagons.sprites()[0].rect
-            return rect.unionall([wagon.rect for wagon in self._wagons.sprites()])
-        else:
-            return None
+        return self._rect
 
     @property
     def spawned(self) -> bool:
-        return self._spawned
+        return bool(self._flags & F_SPAWNED)
 
     @property
     def moving(self) -> bool:
-        return self._moving
+        return bool(self._flags & F_MOVING)
 
     @property
     def waiting(self) -> bool:
-        return self._waiting
+        return bool(self._flags & F_WAITING)
 
     @property
     def wagons(self) -> pg.sprite.Group:
         return self._wagons
 
+    @property
+    def first_wagon(self) -> WagonSprite:
+        # Front-facing wagon in the current direction
+        return self._wagons_tuple[0 if self.direction == FORWARD else -1]
+
     @property
     def entry_portal(self) -> str:
         return self._entry_portal
@@ -364,7 +476,9 @@ class Train:
 
     @property
     def platform_status(self) -> str:
-        return self._platform_status
+        if not self._flags & F_PLATFORM_REACHED:
+            return PENDING
+        return SUCCEEDED if self._flags & F_PLATFORM_SUCCEEDED else FAILED
 
     @property
     def exit_portal(self) -> str:
@@ -372,6 +486,8 @@ class Train:
 
     @property
     def exit_portal_status(self) -> str:
-        return self._exit_portal_status
+        if not self._flags & F_EXIT_PORTAL_REACHED:
+            return PENDING
+        return SUCCEEDED if self._flags & F_EXIT_PORTAL_SUCCEEDED else FAILED
 
 
@@ -26,16 +26,18 @@ class WagonSprite(pg.sprite.Sprite):
         self.rect = self.image.get_rect()
 
     def update(self, position_axle_1, position_axle_2):
-        diff_vector = position_axle_1 - position_axle_2
-        angle = math.atan(diff_vector.y / diff_vector.x) / math.pi * 180
+        # Axle positions are (x, y) pairs, e.g. rows of the train's trajectory array
+        diff_x = position_axle_1[0] - position_axle_2[0]
+        diff_y = position_axle_1[1] - position_axle_2[1]
+        angle = math.atan(diff_y / diff_x) / math.pi * 180
         self.image = pg.transform.rotate(self._original_image, -angle)
         self.rect = self.image.get_rect()
 
         if DEBUG:
             pg.draw.rect(self.image, pg.Color("lightcoral"), self.rect, width=1)
 
-        self.rect.centerx = (position_axle_1.x + position_axle_2.x) / 2
-        self.rect.centery = (position_axle_1.y + position_axle_2.y) / 2
+        self.rect.centerx = (position_axle_1[0] + position_axle_2[0]) / 2
+        self.rect.centery = (position_axle_1[1] + position_axle_2[1]) / 2
 
     @property
     def length(self) -> int: